@@ -1,6 +1,6 @@
 import os
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -13,9 +13,9 @@ import json
 
 import pandas as pd
 
-from api import GoogleSheetsApi
 from model.transaction import Transaction
-from utils import flatten_dict, df_to_sheet_range, categorize_transaction, group_df_by_year, group_df_by_month
+from sinks import OutputSink, GoogleSheetsSink, XlsxSink, ParquetSink, CsvSink, write_to_sinks
+from utils import flatten_dict, categorize_transaction, group_df_by_year, group_df_by_month
 
 
 def string_processing(string: str) -> str:
@@ -44,13 +44,54 @@ def extract_data_from_dict(attribute_dict: Dict[str, str]) -> List[Transaction]:
     return transaction_list
 
 
-def main(username: str, password: str) -> None:
+SINK_NAMES = ("sheets", "xlsx", "parquet", "csv")
+
+
+def create_sinks(sink_names: List[str], output_dir: str, timestamp: str) -> List[OutputSink]:
+    """
+    Creates the output sinks that shall receive the categorised transactions.
+
+    Args:
+        sink_names: Names of the requested sinks. Supported are sheets, xlsx, parquet and csv. Names are case
+            insensitive and repeated names are only used once.
+        output_dir: Directory the local sinks write their files to.
+        timestamp: Timestamp of the current run, used to name the local output files.
+    """
+    sink_names = list(dict.fromkeys(sink_name.strip().lower() for sink_name in sink_names))
+    if not sink_names:
+        raise ValueError(f"No output sink selected. Choose from {', '.join(SINK_NAMES)}.")
+
+    # Validate all names first, so that a typo does not trigger the Google OAuth flow of a preceding sink.
+    unknown_sink_names = [sink_name for sink_name in sink_names if sink_name not in SINK_NAMES]
+    if unknown_sink_names:
+        raise ValueError(f"Unknown output sink(s) {unknown_sink_names}. Choose from {', '.join(SINK_NAMES)}.")
+
+    sinks = []
+    for sink_name in sink_names:
+        if sink_name == "sheets":
+            sinks.append(GoogleSheetsSink("Final_sheet"))
+        elif sink_name == "xlsx":
+            sinks.append(XlsxSink(os.path.join(output_dir, f"transactions_{timestamp}.xlsx")))
+        elif sink_name == "parquet":
+            sinks.append(ParquetSink(os.path.join(output_dir, f"transactions_{timestamp}_parquet")))
+        elif sink_name == "csv":
+            sinks.append(CsvSink(os.path.join(output_dir, f"transactions_{timestamp}_csv")))
+    return sinks
+
+
+def main(username: str, password: str, sink_names: Optional[List[str]] = None, output_dir: str = ".") -> None:
+    if sink_names is None:
+        sink_names = ["sheets"]
+    timestamp = datetime.now().strftime("%d:%m:%Y_%H_%M_%S")
+
+    # Set up all sinks before the 2FA login, so that invalid names or missing dependencies fail early.
+    sinks = create_sinks(sink_names, output_dir, timestamp)
+
     dkb_api = DKBApi(dkb_user=username, dkb_password=password, mfa_device_idx=0)
     dkb_api.login()
 
     account_info = dkb_api.get_accounts()
     transactions = dkb_api.get_transactions(account_info["data"][0]["id"])
-    timestamp = datetime.now().strftime("%d:%m:%Y_%H_%M_%S")
 
     with open(f"transactions_{timestamp}.json", 'w') as json_file:
         json.dump(transactions, json_file, indent=4)
@@ -58,8 +99,6 @@ def main(username: str, password: str) -> None:
     with open(f"transactions_{timestamp}.json") as f:
         transaction_data = json.load(f)["data"]
 
-    google_sheet_api = GoogleSheetsApi()
-
     model_instances = [Transaction(**item) for item in transaction_data]
     data_dicts = [flatten_dict(instance.dict()) for instance in model_instances]
     df = pd.DataFrame(data_dicts)
@@ -75,13 +114,6 @@ def main(username: str, password: str) -> None:
     # Insert reformatted header into df
     df_list.insert(0, header)
 
-    sheet_range = df_to_sheet_range(df_list)
-    sheet_id = google_sheet_api.create("Final_sheet")
-
-    # Add all raw transactions to sheet
-    google_sheet_api.rename_sheet(sheet_id, "RAW_DATA")
-    google_sheet_api.add_data(sheet_id, f"RAW_DATA!{sheet_range}", "USER_ENTERED", df_list)
-
     # Categories all transactions
     df = categorize_transaction(df)
     header = df.columns.tolist()
@@ -90,7 +122,8 @@ def main(username: str, password: str) -> None:
     # Group all categorised transactions by year
     dfs_by_year = group_df_by_year(df.copy())
 
-    # Write categorised data into separate year tabs
+    # Prepare categorised data for separate year tabs
+    data_by_year = {}
     for year, data in dfs_by_year.items():
         sum_row_start = 2
 
@@ -112,12 +145,15 @@ def main(username: str, password: str) -> None:
                                                           index=month_data.columns)
             sum_row_start = sum_row_end + 3
 
-        google_sheet_api.add_new_sheet(sheet_id, year)
         data = extended_df.values.tolist()
         data.insert(0, header)
-        sheet_range = df_to_sheet_range(data)
-        google_sheet_api.add_data(sheet_id, f"{year}!{sheet_range}", "USER_ENTERED", data)
+        data_by_year[year] = data
+
+    # Write raw transactions and year tabs into all sinks at once
+    write_to_sinks(sinks, df_list, data_by_year)
 
 
 if __name__ == '__main__':
-    main(username=os.environ.get("DKB_USERNAME"), password=os.environ.get("DKB_PASSWORD"))
+    main(username=os.environ.get("DKB_USERNAME"), password=os.environ.get("DKB_PASSWORD"),
+         sink_names=[name.strip() for name in os.environ.get("OUTPUT_SINKS", "sheets").split(",") if name.strip()],
+         output_dir=os.environ.get("OUTPUT_DIR", "."))
@@ -0,0 +1,7 @@
+from sinks.output_sink import OutputSink
+from sinks.output_sink import RAW_DATA_SHEET
+from sinks.output_sink import write_to_sinks
+from sinks.google_sheet_sink import GoogleSheetsSink
+from sinks.local_sinks import CsvSink
+from sinks.local_sinks import ParquetSink
+from sinks.local_sinks import XlsxSink
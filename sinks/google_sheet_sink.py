@@ -0,0 +1,36 @@
+from typing import Any, List
+
+from api import GoogleSheetsApi
+from utils import df_to_sheet_range
+from sinks.output_sink import OutputSink
+
+
+class GoogleSheetsSink(OutputSink):
+
+    def __init__(self, title: str = "Final_sheet", google_sheet_api: GoogleSheetsApi = None):
+        """
+        Output sink that uploads all tabs into a newly created Google Sheet.
+
+        Args:
+            title: Title of the Google Sheet that will be created.
+            google_sheet_api: Authenticated Google Sheets API client. A new one is created, if set to None.
+        """
+        self.title = title
+        # Authenticate on construction, so that a possible OAuth flow does not run inside a worker thread.
+        self.google_sheet_api = google_sheet_api if google_sheet_api is not None else GoogleSheetsApi()
+        self.sheet_id = None
+        self._first_sheet_written = False
+
+    def open(self) -> None:
+        self.sheet_id = self.google_sheet_api.create(self.title)
+        self._first_sheet_written = False
+
+    def write_sheet(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        # A new spreadsheet always comes with one empty sheet, which is reused for the first tab.
+        if self._first_sheet_written:
+            self.google_sheet_api.add_new_sheet(self.sheet_id, sheet_name)
+        else:
+            self.google_sheet_api.rename_sheet(self.sheet_id, sheet_name)
+            self._first_sheet_written = True
+        sheet_range = df_to_sheet_range(rows)
+        self.google_sheet_api.add_data(self.sheet_id, f"{sheet_name}!{sheet_range}", "USER_ENTERED", rows)
@@ -0,0 +1,206 @@
+import csv
+import io
+import math
+import os
+import re
+import shutil
+from itertools import islice
+from typing import Any, Iterator, List
+
+from sinks.output_sink import OutputSink, RAW_DATA_SHEET
+
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+_DECIMAL_PATTERN = re.compile(r"^[+-]?\d+(\.\d+)?$")
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _to_cell_value(value: Any) -> Any:
+    """Interprets plain decimal strings as numbers, like Google Sheets does for USER_ENTERED input."""
+    if _is_missing(value):
+        return None
+    if isinstance(value, str) and _DECIMAL_PATTERN.match(value):
+        number = float(value)
+        if math.isfinite(number):
+            return number
+    return value
+
+
+def _is_summary_row(row: List[Any]) -> bool:
+    """Returns True for the monthly SUM and separator rows of the year tabs."""
+    return all(isinstance(value, str) and (value.strip() == "" or value.startswith("=") or set(value) == {"-"})
+               for value in row)
+
+
+class XlsxSink(OutputSink):
+
+    def __init__(self, file_path: str):
+        """
+        Output sink that writes all tabs into a single XLSX workbook.
+
+        The workbook is opened in write-only mode, which streams rows to disk instead of building all cells in memory.
+        The file is only saved if all tabs were written successfully.
+
+        Args:
+            file_path: Path of the XLSX file that will be created.
+        """
+        if Workbook is None:
+            raise ImportError("The xlsx output requires openpyxl. Install it via `pip install openpyxl`.")
+        self.file_path = file_path
+        self.workbook = None
+
+    def open(self) -> None:
+        self.workbook = Workbook(write_only=True)
+
+    def write_sheet(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        worksheet = self.workbook.create_sheet(title=sheet_name)
+        for row in rows:
+            worksheet.append([_to_cell_value(value) for value in row])
+
+    def close(self) -> None:
+        if self.workbook is None:
+            return
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.workbook.save(self.file_path)
+        self.workbook = None
+
+    def discard(self) -> None:
+        if self.workbook is None:
+            return
+        # Saving closes the streaming writers of all worksheets and removes their temporary files.
+        self.workbook.save(io.BytesIO())
+        self.workbook = None
+
+
+class _DirectorySink(OutputSink):
+    """
+    Base class for sinks that write one file per tab into a directory.
+
+    Files are written into a staging directory next to output_dir, which is renamed to output_dir once all tabs were
+    written successfully and removed after a failed write.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.staging_dir = f"{output_dir.rstrip(os.sep)}.partial"
+
+    def _file_path(self, sheet_name: str, extension: str) -> str:
+        return os.path.join(self.staging_dir, f"{sheet_name}.{extension}")
+
+    def open(self) -> None:
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        os.makedirs(self.staging_dir)
+
+    def close(self) -> None:
+        os.replace(self.staging_dir, self.output_dir)
+
+    def discard(self) -> None:
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+class CsvSink(_DirectorySink):
+
+    def __init__(self, output_dir: str):
+        """
+        Output sink that writes every tab into a separate UTF-8 encoded CSV file named after the tab.
+
+        Args:
+            output_dir: Directory the CSV files will be written to.
+        """
+        super().__init__(output_dir)
+
+    def write_sheet(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        with open(self._file_path(sheet_name, "csv"), "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            for row in rows:
+                writer.writerow(["" if _is_missing(value) else value for value in row])
+
+
+class ParquetSink(_DirectorySink):
+
+    def __init__(self, output_dir: str, batch_size: int = 10000):
+        """
+        Output sink that writes every tab into a separate Parquet file named after the tab.
+
+        Rows are written in record batches of batch_size rows. Plain decimal strings are read as numbers and the
+        column types are inferred from the first batch, falling back to strings for columns without a common type.
+        The monthly SUM and separator rows of the year tabs are left out, since formulas have no meaning in Parquet.
+
+        Args:
+            output_dir: Directory the Parquet files will be written to.
+            batch_size: Number of rows per written record batch.
+        """
+        if pa is None:
+            raise ImportError("The parquet output requires pyarrow. Install it via `pip install pyarrow`.")
+        super().__init__(output_dir)
+        self.batch_size = batch_size
+
+    def write_raw_data(self, rows: List[List[Any]]) -> None:
+        self._write_table(RAW_DATA_SHEET, rows, skip_summary_rows=False)
+
+    def write_sheet(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        self._write_table(sheet_name, rows, skip_summary_rows=True)
+
+    def _batches(self, rows: List[List[Any]], skip_summary_rows: bool) -> Iterator[List[List[Any]]]:
+        body = islice(rows, 1, None)
+        if skip_summary_rows:
+            body = (row for row in body if not _is_summary_row(row))
+        while True:
+            batch = [[_to_cell_value(value) for value in row] for row in islice(body, self.batch_size)]
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def _infer_type(values: List[Any]) -> "pa.DataType":
+        try:
+            data_type = pa.array(values).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.string()
+        if pa.types.is_null(data_type):
+            return pa.string()
+        # Whole amounts in the first batch must not prevent decimal amounts in later batches.
+        if pa.types.is_integer(data_type):
+            return pa.float64()
+        return data_type
+
+    @staticmethod
+    def _to_array(values: List[Any], data_type: "pa.DataType") -> "pa.Array":
+        if pa.types.is_string(data_type):
+            values = [None if value is None else str(value) for value in values]
+        return pa.array(values, type=data_type)
+
+    def _write_table(self, sheet_name: str, rows: List[List[Any]], skip_summary_rows: bool) -> None:
+        header = [str(column_name) for column_name in rows[0]]
+        schema = None
+        writer = None
+        try:
+            for batch in self._batches(rows, skip_summary_rows):
+                columns = [[row[idx] for row in batch] for idx in range(len(header))]
+                if writer is None:
+                    schema = pa.schema([pa.field(column_name, self._infer_type(values))
+                                        for column_name, values in zip(header, columns)])
+                    writer = pq.ParquetWriter(self._file_path(sheet_name, "parquet"), schema)
+                arrays = [self._to_array(values, field.type) for values, field in zip(columns, schema)]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            if writer is None:
+                schema = pa.schema([pa.field(column_name, pa.string()) for column_name in header])
+                writer = pq.ParquetWriter(self._file_path(sheet_name, "parquet"), schema)
+        finally:
+            if writer is not None:
+                writer.close()
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence
+
+RAW_DATA_SHEET = "RAW_DATA"
+
+
+class OutputSink(ABC):
+    """
+    Destination for the RAW_DATA tab and the categorised per-year tabs.
+
+    Every tab is handed over as a list of rows, where the first row is the header. Sinks write rows one by one and
+    do not build a second copy of a tab, so writing adds little memory on top of the rows held by the caller.
+    """
+
+    def open(self) -> None:
+        """Prepares the sink before the first tab is written."""
+
+    @abstractmethod
+    def write_sheet(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        """Writes a single tab. The first row of rows is the header."""
+
+    def close(self) -> None:
+        """Flushes and releases all resources held by the sink."""
+
+    def discard(self) -> None:
+        """Releases all resources after a failed write. Sinks that write files remove their partial output here."""
+        self.close()
+
+    def write_raw_data(self, rows: List[List[Any]]) -> None:
+        self.write_sheet(RAW_DATA_SHEET, rows)
+
+    def write_year(self, year: str, rows: List[List[Any]]) -> None:
+        self.write_sheet(year, rows)
+
+    def __enter__(self) -> "OutputSink":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def _write_to_sink(sink: OutputSink, raw_data: List[List[Any]], data_by_year: Dict[str, List[List[Any]]]) -> None:
+    with sink:
+        sink.write_raw_data(raw_data)
+        for year, rows in data_by_year.items():
+            sink.write_year(year, rows)
+
+
+def write_to_sinks(sinks: Sequence[OutputSink], raw_data: List[List[Any]],
+                   data_by_year: Dict[str, List[List[Any]]]) -> None:
+    """
+    Writes the raw and the categorised data into all sinks concurrently.
+
+    Args:
+        sinks: Output sinks that shall receive the data. Each sink is written by its own thread.
+        raw_data: Rows of the RAW_DATA tab including the header row.
+        data_by_year: Rows of each year tab including the header row, keyed by year.
+    """
+    if not sinks:
+        return
+    with ThreadPoolExecutor(max_workers=len(sinks)) as executor:
+        futures = [executor.submit(_write_to_sink, sink, raw_data, data_by_year) for sink in sinks]
+        # Re-raise the first error of any sink once all sinks are done.
+        for future in futures:
+            future.result()
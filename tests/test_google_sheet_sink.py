@@ -0,0 +1,39 @@
+from sinks import GoogleSheetsSink, write_to_sinks
+
+
+class FakeGoogleSheetsApi:
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, title):
+        self.calls.append(("create", title))
+        return "sheet-id"
+
+    def rename_sheet(self, spreadsheet_id, sheet_name):
+        self.calls.append(("rename_sheet", spreadsheet_id, sheet_name))
+
+    def add_new_sheet(self, spreadsheet_id, sheet_name):
+        self.calls.append(("add_new_sheet", spreadsheet_id, sheet_name))
+
+    def add_data(self, spreadsheet_id, range_name, value_input_option, data):
+        self.calls.append(("add_data", spreadsheet_id, range_name, value_input_option, data))
+
+
+def test_google_sheets_sink_renames_first_tab_and_adds_later_tabs():
+    google_sheet_api = FakeGoogleSheetsApi()
+    raw_data = [["id", "value"], ["2024-01-05", -12.5]]
+    data_2023 = [["id", "value"], ["2023-12-24", 3.0], ["2023-12-31", 1.0]]
+    data_2024 = [["id", "value"], ["2024-01-05", -12.5]]
+
+    write_to_sinks([GoogleSheetsSink("Report", google_sheet_api)], raw_data, {"2023": data_2023, "2024": data_2024})
+
+    assert google_sheet_api.calls == [
+        ("create", "Report"),
+        ("rename_sheet", "sheet-id", "RAW_DATA"),
+        ("add_data", "sheet-id", "RAW_DATA!A1:B2", "USER_ENTERED", raw_data),
+        ("add_new_sheet", "sheet-id", "2023"),
+        ("add_data", "sheet-id", "2023!A1:B3", "USER_ENTERED", data_2023),
+        ("add_new_sheet", "sheet-id", "2024"),
+        ("add_data", "sheet-id", "2024!A1:B2", "USER_ENTERED", data_2024),
+    ]
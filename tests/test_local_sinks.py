@@ -0,0 +1,151 @@
+import csv
+import os
+
+import pytest
+
+from sinks import CsvSink, ParquetSink, RAW_DATA_SHEET, XlsxSink, write_to_sinks
+from sinks.local_sinks import _to_cell_value
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("12", 12.0),
+    ("-12.5", -12.5),
+    ("+0.25", 0.25),
+    ("0", 0.0),
+])
+def test_to_cell_value_converts_plain_decimals(value, expected):
+    assert _to_cell_value(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "infinity", "inf", "-inf", "nan", "NaN", "1_000", "1e5", "1.", ".5", " 12", "12,5", "rewe", "=SUM(A2:A3)", " ",
+])
+def test_to_cell_value_keeps_other_strings(value):
+    assert _to_cell_value(value) == value
+
+
+def test_to_cell_value_rejects_non_finite_numbers():
+    huge = "9" * 400
+    assert _to_cell_value(huge) == huge
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    (float("nan"), None),
+    (-3.5, -3.5),
+    (7, 7),
+])
+def test_to_cell_value_passes_non_strings_through(value, expected):
+    assert _to_cell_value(value) == expected
+
+
+RAW_DATA = [
+    ["id", "name", "value"],
+    ["2024-01-05 00:00:00.000000", "Müller", -12.5],
+    ["2024-02-01 00:00:00.000000", "rewe", 3.0],
+]
+YEAR_DATA = [
+    ["id", "value", "Lebensmittel", "Sonstiges"],
+    ["2024-01-05 00:00:00.000000", -12.5, "0", -12.5],
+    [" ", " ", "=SUM(C2:C2)", "=SUM(D2:D2)"],
+    ["------------------"] * 4,
+    ["2024-02-01 00:00:00.000000", 3.0, 3.0, "0"],
+    [" ", " ", "=SUM(C5:C5)", "=SUM(D5:D5)"],
+    ["------------------"] * 4,
+]
+
+
+class FailingSinkMixin:
+    """Fails on the second tab, after RAW_DATA was written successfully."""
+
+    def write_sheet(self, sheet_name, rows):
+        if sheet_name != RAW_DATA_SHEET:
+            raise RuntimeError("write failed")
+        super().write_sheet(sheet_name, rows)
+
+
+def write(sink):
+    write_to_sinks([sink], RAW_DATA, {"2024": YEAR_DATA})
+
+
+def test_csv_sink_round_trip(tmp_path):
+    write(CsvSink(str(tmp_path / "csv")))
+
+    assert sorted(os.listdir(tmp_path)) == ["csv"]
+    assert sorted(os.listdir(tmp_path / "csv")) == ["2024.csv", "RAW_DATA.csv"]
+    with open(tmp_path / "csv" / "RAW_DATA.csv", encoding="utf-8", newline="") as csv_file:
+        assert list(csv.reader(csv_file)) == [
+            ["id", "name", "value"],
+            ["2024-01-05 00:00:00.000000", "Müller", "-12.5"],
+            ["2024-02-01 00:00:00.000000", "rewe", "3.0"],
+        ]
+    with open(tmp_path / "csv" / "2024.csv", encoding="utf-8", newline="") as csv_file:
+        assert len(list(csv.reader(csv_file))) == len(YEAR_DATA)
+
+
+def test_csv_sink_leaves_no_partial_files(tmp_path):
+    class FailingCsvSink(FailingSinkMixin, CsvSink):
+        pass
+
+    with pytest.raises(RuntimeError):
+        write(FailingCsvSink(str(tmp_path / "csv")))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_xlsx_sink_round_trip(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    file_path = tmp_path / "transactions.xlsx"
+
+    write(XlsxSink(str(file_path)))
+
+    workbook = openpyxl.load_workbook(file_path)
+    assert workbook.sheetnames == [RAW_DATA_SHEET, "2024"]
+    assert list(workbook[RAW_DATA_SHEET].values) == [tuple(row) for row in RAW_DATA]
+    year_rows = list(workbook["2024"].values)
+    assert year_rows[1] == ("2024-01-05 00:00:00.000000", -12.5, 0, -12.5)
+    assert year_rows[2] == (" ", " ", "=SUM(C2:C2)", "=SUM(D2:D2)")
+
+
+def test_xlsx_sink_leaves_no_partial_file(tmp_path):
+    pytest.importorskip("openpyxl")
+
+    class FailingXlsxSink(FailingSinkMixin, XlsxSink):
+        pass
+
+    with pytest.raises(RuntimeError):
+        write(FailingXlsxSink(str(tmp_path / "transactions.xlsx")))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_parquet_sink_round_trip(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    write(ParquetSink(str(tmp_path / "parquet"), batch_size=1))
+
+    assert sorted(os.listdir(tmp_path / "parquet")) == ["2024.parquet", "RAW_DATA.parquet"]
+    raw_table = pq.read_table(tmp_path / "parquet" / "RAW_DATA.parquet")
+    assert raw_table.schema.types == [pa.string(), pa.string(), pa.float64()]
+    assert raw_table.column("value").to_pylist() == [-12.5, 3.0]
+
+    year_table = pq.read_table(tmp_path / "parquet" / "2024.parquet")
+    assert year_table.schema.types == [pa.string(), pa.float64(), pa.float64(), pa.float64()]
+    # The SUM and separator rows are dropped.
+    assert year_table.to_pylist() == [
+        {"id": "2024-01-05 00:00:00.000000", "value": -12.5, "Lebensmittel": 0.0, "Sonstiges": -12.5},
+        {"id": "2024-02-01 00:00:00.000000", "value": 3.0, "Lebensmittel": 3.0, "Sonstiges": 0.0},
+    ]
+
+
+def test_parquet_sink_leaves_no_partial_files(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    class FailingParquetSink(FailingSinkMixin, ParquetSink):
+        pass
+
+    with pytest.raises(RuntimeError):
+        write(FailingParquetSink(str(tmp_path / "parquet")))
+
+    assert os.listdir(tmp_path) == []
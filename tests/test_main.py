@@ -0,0 +1,22 @@
+import pytest
+
+from main import create_sinks
+from sinks import CsvSink
+
+
+@pytest.mark.parametrize("sink_names", [["csv", "xslx"], ["Sheets", "google"]])
+def test_create_sinks_rejects_unknown_names(sink_names, tmp_path):
+    with pytest.raises(ValueError, match="Unknown output sink"):
+        create_sinks(sink_names, str(tmp_path), "timestamp")
+
+
+def test_create_sinks_rejects_empty_selection(tmp_path):
+    with pytest.raises(ValueError, match="No output sink selected"):
+        create_sinks([], str(tmp_path), "timestamp")
+
+
+def test_create_sinks_ignores_case_and_repeated_names(tmp_path):
+    sinks = create_sinks(["CSV", "csv", " Csv "], str(tmp_path), "timestamp")
+
+    assert len(sinks) == 1
+    assert isinstance(sinks[0], CsvSink)
@@ -0,0 +1,61 @@
+import pytest
+
+from sinks import OutputSink, write_to_sinks
+
+
+class RecordingSink(OutputSink):
+
+    def __init__(self):
+        self.events = []
+
+    def open(self):
+        self.events.append("open")
+
+    def write_sheet(self, sheet_name, rows):
+        self.events.append((sheet_name, rows))
+
+    def close(self):
+        self.events.append("close")
+
+    def discard(self):
+        self.events.append("discard")
+
+
+class FailingSink(RecordingSink):
+
+    def write_sheet(self, sheet_name, rows):
+        raise RuntimeError(f"Cannot write {sheet_name}")
+
+
+RAW_DATA = [["id", "value"], ["2024-01-05", -12.5]]
+DATA_BY_YEAR = {"2023": [["id", "value"], ["2023-12-24", 3.0]], "2024": [["id", "value"], ["2024-01-05", -12.5]]}
+
+
+def test_write_to_sinks_writes_all_tabs_into_every_sink():
+    sinks = [RecordingSink(), RecordingSink()]
+
+    write_to_sinks(sinks, RAW_DATA, DATA_BY_YEAR)
+
+    for sink in sinks:
+        assert sink.events == [
+            "open",
+            ("RAW_DATA", RAW_DATA),
+            ("2023", DATA_BY_YEAR["2023"]),
+            ("2024", DATA_BY_YEAR["2024"]),
+            "close",
+        ]
+
+
+def test_write_to_sinks_reraises_error_of_a_single_sink():
+    healthy_sink = RecordingSink()
+    failing_sink = FailingSink()
+
+    with pytest.raises(RuntimeError, match="Cannot write RAW_DATA"):
+        write_to_sinks([failing_sink, healthy_sink], RAW_DATA, DATA_BY_YEAR)
+
+    assert failing_sink.events == ["open", "discard"]
+    assert healthy_sink.events[-1] == "close"
+
+
+def test_write_to_sinks_without_sinks_does_nothing():
+    write_to_sinks([], RAW_DATA, DATA_BY_YEAR)